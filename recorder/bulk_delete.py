@@ -0,0 +1,136 @@
+# recorder/bulk_delete.py
+# bulk deletion jobs: rows are removed from the DB in one transaction up front,
+# then a background worker unlinks the video files and thumbnails and reports progress.
+# the files to unlink are persisted in pending_unlinks alongside the row delete, so
+# anything left when the process dies is requeued by the next start().
+
+import queue
+import threading
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+
+class BulkDeleter:
+    def __init__(self, db, throttle_seconds: float = 0.005, max_finished_jobs: int = 50):
+        self.db = db
+        # short pause between unlinks so large jobs don't starve the recorder's disk I/O
+        self.throttle = throttle_seconds
+        self.max_finished_jobs = max_finished_jobs
+        self._jobs = {}
+        self._lock = threading.Lock()
+        self._queue = queue.Queue()
+        self._stop = threading.Event()
+        self._thread = None
+        self._recovered = False
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        if not self._recovered:
+            # unlinks left over from a previous run; later restarts still have them queued
+            self._recovered = True
+            leftover = self.db.list_pending_unlinks()
+            if leftover:
+                self._enqueue(leftover)
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=3)
+
+    def submit(self, ids=None, **filters):
+        """
+        Removes the matching rows immediately and queues their files for unlinking.
+        Returns the job dict (see get_job) for polling.
+        """
+        return self._enqueue(self.db.delete_many(ids=ids, **filters))
+
+    def _enqueue(self, removed):
+        job_id = uuid.uuid4().hex[:12]
+        job = {
+            "id": job_id,
+            "status": "queued" if removed else "done",
+            "total": len(removed),
+            "processed": 0,
+            "files_removed": 0,
+            "bytes_freed": 0,
+            "errors": 0,
+            "error": None,
+            "created_at": datetime.utcnow().isoformat(),
+            "finished_at": None if removed else datetime.utcnow().isoformat(),
+        }
+        with self._lock:
+            self._jobs[job_id] = job
+            self._prune_locked()
+            snapshot = dict(job)
+        if removed:
+            self._queue.put((job_id, removed))
+        return snapshot
+
+    def get_job(self, job_id):
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return dict(job) if job else None
+
+    def _prune_locked(self):
+        finished = [j for j in self._jobs.values() if j["status"] in ("done", "failed")]
+        if len(finished) <= self.max_finished_jobs:
+            return
+        finished.sort(key=lambda j: j["finished_at"] or "")
+        for j in finished[:len(finished) - self.max_finished_jobs]:
+            del self._jobs[j["id"]]
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                job_id, removed = self._queue.get(timeout=1)
+            except queue.Empty:
+                continue
+            status, error = "done", None
+            try:
+                self._process(job_id, removed)
+            except Exception as e:
+                # keep the worker alive, but make the failure visible to pollers
+                print("BulkDeleter error:", e)
+                status, error = "failed", str(e)
+            with self._lock:
+                job = self._jobs.get(job_id)
+                if job:
+                    job["status"] = status
+                    job["error"] = error
+                    job["finished_at"] = datetime.utcnow().isoformat()
+
+    def _process(self, job_id, removed):
+        with self._lock:
+            self._jobs[job_id]["status"] = "running"
+        for pending_id, path, thumb in removed:
+            freed, files, errors = 0, 0, 0
+            for p in (path, thumb):
+                if not p:
+                    continue
+                p = Path(p)
+                try:
+                    size = p.stat().st_size
+                    p.unlink()
+                    freed += size
+                    files += 1
+                except FileNotFoundError:
+                    pass
+                except OSError as e:
+                    print("BulkDeleter: failed to remove", p, e)
+                    errors += 1
+            if not errors:
+                # failed unlinks stay pending and are retried on the next start
+                self.db.clear_pending_unlink(pending_id)
+            with self._lock:
+                job = self._jobs[job_id]
+                job["processed"] += 1
+                job["files_removed"] += files
+                job["bytes_freed"] += freed
+                job["errors"] += errors
+            if self.throttle:
+                time.sleep(self.throttle)
@@ -3,7 +3,7 @@
 
 import sqlite3
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, date, timezone
 
 class Database:
     def __init__(self, db_path):
@@ -30,6 +30,14 @@ class Database:
             thumbnail_path TEXT DEFAULT NULL,
             created_at TEXT DEFAULT CURRENT_TIMESTAMP
         )""")
+        # files whose rows were bulk-deleted but not yet unlinked; survives restarts
+        cur.execute("""
+        CREATE TABLE IF NOT EXISTS pending_unlinks (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            path TEXT NOT NULL,
+            thumbnail_path TEXT DEFAULT NULL,
+            created_at TEXT DEFAULT CURRENT_TIMESTAMP
+        )""")
         conn.commit()
         conn.close()
 
@@ -94,8 +102,8 @@ class Database:
         conn.commit()
         conn.close()
 
-    def search(self, date_from=None, date_to=None, min_duration=None, max_duration=None, min_size=None, max_size=None, motion=None, limit=200, offset=0):
-        q = "SELECT id, filename, path, start_ts, end_ts, size_bytes, duration_seconds, motion_detected, thumbnail_path FROM recordings WHERE 1=1"
+    def _filter_clause(self, date_from=None, date_to=None, min_duration=None, max_duration=None, min_size=None, max_size=None, motion=None, start_from=None, start_to=None):
+        q = ""
         params = []
         if date_from:
             q += " AND DATE(start_ts) >= ?"
@@ -103,6 +111,12 @@ class Database:
         if date_to:
             q += " AND DATE(start_ts) <= ?"
             params.append(date_to)
+        if start_from:
+            q += " AND start_ts >= ?"
+            params.append(start_from)
+        if start_to:
+            q += " AND start_ts < ?"
+            params.append(start_to)
         if min_duration is not None:
             q += " AND duration_seconds >= ?"
             params.append(min_duration)
@@ -118,6 +132,12 @@ class Database:
         if motion is not None:
             q += " AND motion_detected = ?"
             params.append(1 if motion else 0)
+        return q, params
+
+    def search(self, date_from=None, date_to=None, min_duration=None, max_duration=None, min_size=None, max_size=None, motion=None, limit=200, offset=0):
+        q = "SELECT id, filename, path, start_ts, end_ts, size_bytes, duration_seconds, motion_detected, thumbnail_path FROM recordings WHERE 1=1"
+        clause, params = self._filter_clause(date_from, date_to, min_duration, max_duration, min_size, max_size, motion)
+        q += clause
         q += " ORDER BY start_ts DESC LIMIT ? OFFSET ?"
         params.extend([limit, offset])
         conn = self._conn()
@@ -127,3 +147,98 @@ class Database:
         conn.close()
         keys = ["id", "filename", "path", "start_ts", "end_ts", "size_bytes", "duration_seconds", "motion_detected", "thumbnail_path"]
         return [dict(zip(keys, r)) for r in rows]
+
+    @staticmethod
+    def _strict_id(value):
+        # bool is an int subclass and int(1.9) == 1; neither should pick a row to delete
+        if isinstance(value, bool):
+            raise ValueError("invalid id: %r" % (value,))
+        if isinstance(value, float) and value.is_integer():
+            return int(value)
+        if not isinstance(value, int) or not -2**63 <= value < 2**63:
+            raise ValueError("invalid id: %r" % (value,))
+        return value
+
+    @staticmethod
+    def _iso_date(key, value):
+        # start_ts is compared as text, so anything but a real ISO date could match every row
+        try:
+            return date.fromisoformat(value).isoformat()
+        except (TypeError, ValueError):
+            raise ValueError("%s must be an ISO date (YYYY-MM-DD): %r" % (key, value))
+
+    @staticmethod
+    def _iso_datetime(key, value):
+        try:
+            dt = datetime.fromisoformat(value)
+        except (TypeError, ValueError):
+            raise ValueError("%s must be an ISO datetime: %r" % (key, value))
+        if dt.tzinfo is not None:
+            # start_ts is stored as naive UTC
+            dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+        return dt.isoformat()
+
+    def delete_many(self, ids=None, **filters):
+        """
+        Deletes every recording matching `ids` and/or the search filters in a single
+        transaction. Their files are recorded in pending_unlinks in the same transaction
+        and returned as (pending_id, path, thumbnail_path), so the caller can unlink them
+        afterwards and clear each entry with clear_pending_unlink.
+        Raises ValueError for invalid ids or dates, or when the selector would match everything.
+        """
+        for key in ("date_from", "date_to"):
+            if filters.get(key) is not None:
+                filters[key] = self._iso_date(key, filters[key])
+        for key in ("start_from", "start_to"):
+            if filters.get(key) is not None:
+                filters[key] = self._iso_datetime(key, filters[key])
+        clause, params = self._filter_clause(**filters)
+        # falsy filter values produce no SQL, so check what was actually built
+        if ids is None and not clause:
+            raise ValueError("refusing to delete without ids or filters")
+        if ids is not None:
+            ids = [self._strict_id(i) for i in ids]
+        conn = self._conn()
+        try:
+            cur = conn.cursor()
+            # take the write lock up front so rows inserted by the recorder between
+            # the SELECT and the DELETE are never removed without being reported
+            cur.execute("BEGIN IMMEDIATE")
+            removed = []
+            id_batches = [None]
+            if ids is not None:
+                # stay under SQLite's host parameter limit on older builds
+                id_batches = [ids[i:i + 500] for i in range(0, len(ids), 500)]
+            for batch in id_batches:
+                where = "WHERE 1=1" + clause
+                batch_params = list(params)
+                if batch is not None:
+                    where += " AND id IN (%s)" % ",".join("?" * len(batch))
+                    batch_params.extend(batch)
+                cur.execute("SELECT path, thumbnail_path FROM recordings " + where, tuple(batch_params))
+                for path, thumb in cur.fetchall():
+                    cur.execute("INSERT INTO pending_unlinks (path, thumbnail_path) VALUES (?, ?)", (path, thumb))
+                    removed.append((cur.lastrowid, path, thumb))
+                cur.execute("DELETE FROM recordings " + where, tuple(batch_params))
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+        return removed
+
+    def list_pending_unlinks(self):
+        conn = self._conn()
+        cur = conn.cursor()
+        cur.execute("SELECT id, path, thumbnail_path FROM pending_unlinks ORDER BY id")
+        rows = cur.fetchall()
+        conn.close()
+        return rows
+
+    def clear_pending_unlink(self, pending_id):
+        conn = self._conn()
+        cur = conn.cursor()
+        cur.execute("DELETE FROM pending_unlinks WHERE id=?", (pending_id,))
+        conn.commit()
+        conn.close()
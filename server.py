@@ -11,6 +11,7 @@ from recorder.storage_manager import StorageManager
 from recorder.models import Database
 from recorder.ffmpeg_runner import RecorderController
 from recorder.cleanup import Cleaner
+from recorder.bulk_delete import BulkDeleter
 
 BASE_DIR = Path(__file__).resolve().parent
 WEB_DIST = BASE_DIR / "web" / "dist"
@@ -35,6 +36,8 @@ storage = StorageManager(DATA_DIR, db, thumbs_dir=str(THUMBS_DIR))
 recorder = RecorderController(storage, log_dir=FFMPEG_LOG_DIR)
 cleaner = Cleaner(db, DATA_DIR, interval_seconds=3600)
 cleaner.start()
+deleter = BulkDeleter(db)
+deleter.start()
 
 
 import os
@@ -163,8 +166,70 @@ def api_delete(recording_id):
     rec = db.get_recording(recording_id)
     if not rec:
         abort(404)
-    storage.delete_recording(rec["path"])
-    return jsonify({"status": "deleted"})
+    # same path as bulk deletes, so the thumbnail goes too and a crash can't strand the files
+    job = deleter.submit(ids=[recording_id])
+    return jsonify({"status": "deleted", "job": job["id"]})
+
+
+_BULK_DELETE_DATE_FILTERS = ("date_from", "date_to")
+_BULK_DELETE_NUMBER_FILTERS = ("min_duration", "max_duration", "min_size", "max_size")
+_BULK_DELETE_FILTERS = _BULK_DELETE_DATE_FILTERS + _BULK_DELETE_NUMBER_FILTERS + ("motion",)
+
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+@app.route("/api/delete", methods=["POST"])
+def api_delete_bulk():
+    """
+    Body (JSON object), any combination of:
+      {"ids": [1, 2, 3]}
+      {"from": "2024-01-01T00:00:00", "to": "2024-01-02T00:00:00"}   # start_ts range, end exclusive
+      {"filters": {"date_from": ..., "motion": false, ...}}          # same filters as /api/search
+    Returns 202 with a job handle; poll /api/delete/jobs/<job_id> for progress.
+    """
+    body = request.get_json(silent=True)
+    if body is None:
+        body = {}
+    if not isinstance(body, dict):
+        abort(400, "Body must be a JSON object")
+    ids = body.get("ids")
+    filters = body.get("filters") or {}
+    if ids is not None and not isinstance(ids, list):
+        abort(400, "ids must be a list")
+    if not isinstance(filters, dict):
+        abort(400, "filters must be an object")
+    unknown = set(filters) - set(_BULK_DELETE_FILTERS)
+    if unknown:
+        abort(400, "Unknown filters: " + ", ".join(sorted(unknown)))
+    filters = {k: v for k, v in filters.items() if v is not None}
+    # date_from/date_to and from/to are parsed and normalised by Database.delete_many,
+    # which raises ValueError (-> 400) on anything that isn't an ISO date/datetime
+    for key, value in filters.items():
+        if key in _BULK_DELETE_NUMBER_FILTERS and not _is_number(value):
+            abort(400, f"{key} must be a number")
+        if key == "motion" and not isinstance(value, bool):
+            abort(400, "motion must be true or false")
+    for key, target in (("from", "start_from"), ("to", "start_to")):
+        if body.get(key) is not None:
+            filters[target] = body[key]
+    # refuse an empty selector rather than wiping every recording
+    if ids is None and not filters:
+        abort(400, "Provide ids, a from/to range or filters")
+    try:
+        job = deleter.submit(ids=ids, **filters)
+    except ValueError as e:
+        abort(400, str(e))
+    return jsonify(job), 202
+
+
+@app.route("/api/delete/jobs/<job_id>")
+def api_delete_job(job_id):
+    job = deleter.get_job(job_id)
+    if not job:
+        abort(404)
+    return jsonify(job)
 
 
 @app.route("/api/recorder/start", methods=["POST"])
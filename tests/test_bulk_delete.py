@@ -0,0 +1,174 @@
+import time
+
+import pytest
+
+from recorder.bulk_delete import BulkDeleter
+from recorder.models import Database
+
+
+@pytest.fixture
+def db(tmp_path):
+    return Database(tmp_path / "nvr.db")
+
+
+def _add(db, tmp_path, name, start_ts, motion=False, size=10, duration=60, files=False):
+    path = tmp_path / f"{name}.mp4"
+    thumb = tmp_path / f"{name}.jpg"
+    if files:
+        path.write_bytes(b"x" * size)
+        thumb.write_bytes(b"y")
+    return db.add_recording(f"{name}.mp4", str(path), start_ts, size=size, duration=duration,
+                            motion=motion, thumbnail_path=str(thumb))
+
+
+def _remaining_ids(db):
+    return sorted(r["id"] for r in db.search(limit=100000))
+
+
+def _wait_done(deleter, job_id, timeout=5):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        job = deleter.get_job(job_id)
+        if job["status"] in ("done", "failed"):
+            return job
+        time.sleep(0.01)
+    raise AssertionError("job did not finish")
+
+
+def test_delete_many_by_ids(db, tmp_path):
+    ids = [_add(db, tmp_path, f"r{i}", "2024-01-01T10:00:00") for i in range(5)]
+    removed = db.delete_many(ids=ids[:2])
+    assert sorted(p for _, p, _ in removed) == sorted(str(tmp_path / f"r{i}.mp4") for i in range(2))
+    assert _remaining_ids(db) == ids[2:]
+
+
+def test_delete_many_range_end_is_exclusive(db, tmp_path):
+    a = _add(db, tmp_path, "a", "2024-01-01T09:59:59")
+    b = _add(db, tmp_path, "b", "2024-01-01T10:00:00")
+    c = _add(db, tmp_path, "c", "2024-01-01T10:30:00")
+    d = _add(db, tmp_path, "d", "2024-01-01T11:00:00")
+    db.delete_many(start_from="2024-01-01T10:00:00", start_to="2024-01-01T11:00:00")
+    assert _remaining_ids(db) == [a, d]
+    assert b not in _remaining_ids(db) and c not in _remaining_ids(db)
+
+
+def test_delete_many_combines_ids_and_filters(db, tmp_path):
+    moving = _add(db, tmp_path, "m", "2024-01-01T10:00:00", motion=True)
+    still = _add(db, tmp_path, "s", "2024-01-01T10:01:00", motion=False)
+    other = _add(db, tmp_path, "o", "2024-01-01T10:02:00", motion=False)
+    db.delete_many(ids=[moving, still], motion=False)
+    assert _remaining_ids(db) == [moving, other]
+
+
+def test_delete_many_batches_large_id_lists(db, tmp_path):
+    ids = [_add(db, tmp_path, f"r{i}", "2024-01-01T10:00:00") for i in range(1203)]
+    removed = db.delete_many(ids=ids[:1201])
+    assert len(removed) == 1201
+    assert _remaining_ids(db) == ids[1201:]
+
+
+@pytest.mark.parametrize("filters", [{}, {"date_from": ""}, {"date_to": 0}, {"start_from": False}])
+def test_delete_many_rejects_empty_selector(db, tmp_path, filters):
+    _add(db, tmp_path, "r", "2024-01-01T10:00:00")
+    with pytest.raises(ValueError):
+        db.delete_many(**filters)
+    assert len(_remaining_ids(db)) == 1
+
+
+@pytest.mark.parametrize("bad", [True, 1.9, "1", None, 2**63, -2**63 - 1])
+def test_delete_many_rejects_non_integer_ids(db, tmp_path, bad):
+    rid = _add(db, tmp_path, "r", "2024-01-01T10:00:00")
+    with pytest.raises(ValueError):
+        db.delete_many(ids=[bad])
+    assert _remaining_ids(db) == [rid]
+
+
+def test_worker_unlinks_video_and_thumbnail(db, tmp_path):
+    ids = [_add(db, tmp_path, f"r{i}", "2024-01-01T10:00:00", size=7, files=True) for i in range(3)]
+    deleter = BulkDeleter(db, throttle_seconds=0)
+    deleter.start()
+    try:
+        job = deleter.submit(ids=ids[:2])
+        assert job["total"] == 2
+        job = _wait_done(deleter, job["id"])
+    finally:
+        deleter.stop()
+    assert job["status"] == "done"
+    assert job["processed"] == 2
+    assert job["files_removed"] == 4
+    assert job["bytes_freed"] == 2 * (7 + 1)
+    assert job["errors"] == 0
+    for i in range(2):
+        assert not (tmp_path / f"r{i}.mp4").exists()
+        assert not (tmp_path / f"r{i}.jpg").exists()
+    assert (tmp_path / "r2.mp4").exists() and (tmp_path / "r2.jpg").exists()
+    assert db.list_pending_unlinks() == []
+
+
+def test_worker_marks_job_failed(db, tmp_path, monkeypatch):
+    rid = _add(db, tmp_path, "r", "2024-01-01T10:00:00", files=True)
+    deleter = BulkDeleter(db, throttle_seconds=0)
+
+    def boom(job_id, removed):
+        raise RuntimeError("disk gone")
+
+    monkeypatch.setattr(deleter, "_process", boom)
+    deleter.start()
+    try:
+        job = _wait_done(deleter, deleter.submit(ids=[rid])["id"])
+    finally:
+        deleter.stop()
+    assert job["status"] == "failed"
+    assert job["error"] == "disk gone"
+
+
+def test_delete_many_normalises_dates(db, tmp_path):
+    early = _add(db, tmp_path, "e", "2024-01-01T23:59:59")
+    late = _add(db, tmp_path, "l", "2024-01-02T00:00:00")
+    # a bare date and a UTC offset both normalise to naive ISO datetimes like start_ts
+    db.delete_many(start_from="2024-01-02", start_to="2024-01-02T01:00:00+01:00")
+    assert _remaining_ids(db) == [early, late]
+    db.delete_many(start_from="2024-01-02")
+    assert _remaining_ids(db) == [early]
+
+
+@pytest.mark.parametrize("filters", [
+    {"start_to": "12/31/2024"},
+    {"start_from": "yesterday"},
+    {"start_from": ["2024-01-01"]},
+    {"date_to": "9"},
+    {"date_from": "2024-01-01T10:00:00"},
+    {"date_from": {}},
+])
+def test_delete_many_rejects_malformed_dates(db, tmp_path, filters):
+    _add(db, tmp_path, "r", "2024-01-01T10:00:00")
+    with pytest.raises(ValueError):
+        db.delete_many(**filters)
+    assert len(_remaining_ids(db)) == 1
+
+
+def test_delete_many_records_pending_unlinks(db, tmp_path):
+    rid = _add(db, tmp_path, "r", "2024-01-01T10:00:00")
+    removed = db.delete_many(ids=[rid])
+    assert db.list_pending_unlinks() == removed
+    db.clear_pending_unlink(removed[0][0])
+    assert db.list_pending_unlinks() == []
+
+
+def test_worker_requeues_pending_unlinks_on_start(db, tmp_path):
+    rid = _add(db, tmp_path, "r", "2024-01-01T10:00:00", files=True)
+    # rows deleted by a run that died before its worker got to the files
+    db.delete_many(ids=[rid])
+    assert (tmp_path / "r.mp4").exists()
+
+    deleter = BulkDeleter(db, throttle_seconds=0)
+    deleter.start()
+    try:
+        deadline = time.time() + 5
+        while db.list_pending_unlinks() and time.time() < deadline:
+            time.sleep(0.01)
+    finally:
+        deleter.stop()
+    assert db.list_pending_unlinks() == []
+    assert not (tmp_path / "r.mp4").exists()
+    assert not (tmp_path / "r.jpg").exists()